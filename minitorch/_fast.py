@@ -0,0 +1,115 @@
+"""Numba-compiled kernels for the elementary operators.
+
+The scalar kernels (`*_nb`) are compiled with `numba.njit` and the array
+kernels (`*_vec`) with `numba.vectorize`, so a NumPy array is processed by a
+single compiled ufunc loop. With `fastmath=True` and Intel SVML available,
+`exp`/`log` in those loops are SIMD vectorized; `USING_SVML` reports whether
+that is the case.
+
+Kernels are compiled on first use, so the first call to each one pays its
+compilation time (about 0.3 s for an array kernel).
+"""
+
+import math
+from typing import Any, Dict, Tuple
+
+import numba
+
+USING_SVML = bool(numba.config.USING_SVML)
+
+_njit = numba.njit(fastmath=True, cache=True)
+_vectorize_1 = numba.vectorize(
+    [numba.float32(numba.float32), numba.float64(numba.float64)],
+    fastmath=True,
+    cache=True,
+)
+_vectorize_2 = numba.vectorize(
+    [
+        numba.float32(numba.float32, numba.float32),
+        numba.float64(numba.float64, numba.float64),
+    ],
+    fastmath=True,
+    cache=True,
+)
+
+
+# Scalar kernels
+
+
+@_njit
+def sigmoid_nb(x: float) -> float:
+    """Sigmoid of `x`."""
+    # Both signs share one `exp` and the sign only picks the result, which
+    # the vectorizer turns into a blend instead of a branch.
+    e = math.exp(-abs(x))
+    s = 1.0 / (1.0 + e)
+    return s if x >= 0.0 else e * s
+
+
+@_njit
+def relu_nb(x: float) -> float:
+    """ReLU of `x`."""
+    return x if x > 0.0 else 0.0
+
+
+@_njit
+def exp_nb(x: float) -> float:
+    """Exponential of `x`."""
+    return math.exp(x)
+
+
+@_njit
+def log_nb(x: float) -> float:
+    """Natural logarithm of `x`."""
+    return math.log(x)
+
+
+@_njit
+def sigmoid_back_nb(x: float, grad: float) -> float:
+    """Sigmoid gradient at `x` times `grad`."""
+    s = sigmoid_nb(x)
+    return s * (1.0 - s) * grad
+
+
+@_njit
+def relu_back_nb(x: float, grad: float) -> float:
+    """ReLU gradient at `x` times `grad`."""
+    return grad if x > 0.0 else 0.0
+
+
+@_njit
+def exp_back_nb(x: float, grad: float) -> float:
+    """Exponential gradient at `x` times `grad`."""
+    return math.exp(x) * grad
+
+
+@_njit
+def log_back_nb(x: float, grad: float) -> float:
+    """Logarithm gradient at `x` times `grad`."""
+    return grad / x
+
+
+# Array kernels: the scalar kernels compiled as elementwise ufuncs. Compiling
+# a ufunc takes a noticeable fraction of a second, so each one is built on
+# first access (PEP 562 module `__getattr__`) rather than at import; only the
+# kernels that are actually used get compiled.
+
+_ARRAY_KERNELS: Dict[str, Tuple[Any, Any]] = {
+    "sigmoid_vec": (_vectorize_1, sigmoid_nb),
+    "relu_vec": (_vectorize_1, relu_nb),
+    "exp_vec": (_vectorize_1, exp_nb),
+    "log_vec": (_vectorize_1, log_nb),
+    "sigmoid_back_vec": (_vectorize_2, sigmoid_back_nb),
+    "relu_back_vec": (_vectorize_2, relu_back_nb),
+    "exp_back_vec": (_vectorize_2, exp_back_nb),
+    "log_back_vec": (_vectorize_2, log_back_nb),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _ARRAY_KERNELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    vectorize, kernel = _ARRAY_KERNELS[name]
+    ufunc = vectorize(kernel.py_func)
+    globals()[name] = ufunc
+    return ufunc
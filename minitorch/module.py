@@ -1,7 +1,33 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, NoReturn, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .operators import DEFAULT_DTYPE
+
+
+class _EmptyStorage(dict):
+    """Empty, read-only dict shared by modules without children or parameters.
+
+    Copying or pickling it produces a fresh, writable `{}`, so copies of a
+    module never share (or try to serialize) the sentinel itself.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("shared empty module storage is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Tuple[type, Tuple[()]]:
+        return dict, ()
+
+
+# Storage shared by every module until it gets its first child or parameter,
+# so leaf modules don't allocate two empty dicts each.
+_EMPTY: Dict[str, Any] = _EmptyStorage()
 
 
 class Module:
@@ -14,60 +40,57 @@ class Module:
         _parameters : Storage of the module's parameters
         training : Whether the module is in training mode or evaluation mode
 
+    Add children and parameters by attribute assignment (or `add_parameter`),
+    never by writing into `_modules`/`_parameters` directly. Until a module
+    gets its first child (or parameter) the corresponding storage is a
+    shared, read-only empty dict, so a direct write raises `TypeError`;
+    once real storage has been allocated a direct write would succeed, but
+    it is still unsupported.
+
     """
 
+    # `__dict__` keeps ordinary attributes working on plain `Module()` instances.
+    __slots__ = ("_modules", "_parameters", "training", "__dict__")
+
     _modules: Dict[str, Module]
     _parameters: Dict[str, Parameter]
     training: bool
 
     def __init__(self) -> None:
-        self._modules = {}
-        self._parameters = {}
+        self._modules = self._parameters = _EMPTY
         self.training = True
 
     def modules(self) -> Sequence[Module]:
         """Return the direct child modules of this module."""
-        m: Dict[str, Module] = self.__dict__["_modules"]
-        return list(m.values())
-
-    def train_deprecated(self) -> None:
-        """Set the mode of this module and all descendent modules to `train`."""
-        # TODO: Implement for Task 0.4.
-        self.training = True
-        nodes_to_process = self._modules.values()
-        future_nodes = []
-        while nodes_to_process:
-            for node in nodes_to_process:
-                node.training = True
-                future_nodes.extend(node._modules.values())
-            nodes_to_process = future_nodes
-            future_nodes = []
+        return list(self._modules.values())
 
     def train(self) -> None:
-        """Set the mode of this module and all descendent modules to `train`.
-        
-        Traverses tree level by level (BFS)
-        """
-        # TODO: Implement for Task 0.4.
-        self.training = True
-        que = deque(self._modules.values())
-        while que:
-            node = que.popleft()
-            node.training = True
-            que.extend(node._modules.values())
+        """Set the mode of this module and all descendent modules to `train`."""
+        self._set_mode(True)
 
     def eval(self) -> None:
-        """Set the mode of this module and all descendent modules to `eval`.
+        """Set the mode of this module and all descendent modules to `eval`."""
+        self._set_mode(False)
+
+    def _set_mode(self, mode: bool) -> None:
+        """Set `training` to `mode` on this module and all descendent modules.
 
         Traverses tree level by level (BFS)
+
+        Performs cycle detection
         """
-        # TODO: Implement for Task 0.4.
-        self.training = False
+        self.training = mode
+        visited = {id(self)}
         que = deque(self._modules.values())
+        popleft = que.popleft
+        extend = que.extend
         while que:
-            node = que.popleft()
-            node.training = False
-            que.extend(node._modules.values())
+            node = popleft()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            node.training = mode
+            extend(node._modules.values())
 
     def named_parameters_deprecated(self) -> Sequence[Tuple[str, Parameter]]:
         """Collect all the parameters of this module and its descendents.
@@ -165,12 +188,53 @@ class Module:
         # TODO: Implement for Task 0.4.
         parameters = list(self._parameters.values())
         que = deque(self._modules.values())
+        popleft = que.popleft
+        extend = que.extend
+        extend_parameters = parameters.extend
         while que:
-            node = que.popleft()
-            que.extend(node._modules.values())
-            parameters.extend(node._parameters.values())
+            node = popleft()
+            extend(node._modules.values())
+            extend_parameters(node._parameters.values())
         return parameters
 
+    def flatten_parameters(self, dtype: Any = None) -> Any:
+        """Move the values of all parameters into one contiguous NumPy array.
+
+        Each `Parameter.value` is replaced by a view into the returned buffer
+        (a 0-d view for scalar values), so an optimizer can update every
+        parameter with a single vectorized operation on the buffer.
+
+        Args:
+        ----
+            dtype: Element type of the buffer, `operators.DEFAULT_DTYPE` if None.
+
+        Returns:
+        -------
+            The flat buffer backing all parameter values.
+
+        """
+        if dtype is None:
+            dtype = DEFAULT_DTYPE
+
+        params = []
+        seen = set()
+        # named_parameters tracks visited modules, so cyclic graphs terminate
+        for _, param in self.named_parameters():
+            if id(param) not in seen:
+                seen.add(id(param))
+                params.append(param)
+
+        values = [np.asarray(param.value, dtype=dtype) for param in params]
+        flat = np.empty(sum(value.size for value in values), dtype=dtype)
+        offset = 0
+        for param, value in zip(params, values):
+            end = offset + value.size
+            view = flat[offset:end].reshape(value.shape)
+            view[...] = value
+            param.update(view)
+            offset = end
+        return flat
+
     def add_parameter(self, k: str, v: Any) -> Parameter:
         """Manually add a parameter. Useful helper for scalar parameters.
 
@@ -185,23 +249,35 @@ class Module:
 
         """
         val = Parameter(v, k)
-        self.__dict__["_parameters"][k] = val
+        setattr(self, k, val)
         return val
 
     def __setattr__(self, key: str, val: Parameter) -> None:
         if isinstance(val, Parameter):
-            self.__dict__["_parameters"][key] = val
+            p = self._parameters
+            if p is _EMPTY:
+                p = {}
+                object.__setattr__(self, "_parameters", p)
+            p[key] = val
         elif isinstance(val, Module):
-            self.__dict__["_modules"][key] = val
+            m = self._modules
+            if m is _EMPTY:
+                m = {}
+                object.__setattr__(self, "_modules", m)
+            m[key] = val
         else:
-            super().__setattr__(key, val)
+            object.__setattr__(self, key, val)
 
     def __getattr__(self, key: str) -> Any:
-        if key in self.__dict__["_parameters"]:
-            return self.__dict__["_parameters"][key]
-
-        if key in self.__dict__["_modules"]:
-            return self.__dict__["_modules"][key]
+        # An unset slot lands here too; bail out instead of recursing.
+        if key in ("_modules", "_parameters", "training"):
+            raise AttributeError(key)
+        p = self._parameters
+        if key in p:
+            return p[key]
+        m = self._modules
+        if key in m:
+            return m[key]
         return None
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
@@ -209,14 +285,7 @@ class Module:
 
     def __repr__(self) -> str:
         def _addindent(s_: str, numSpaces: int) -> str:
-            s2 = s_.split("\n")
-            if len(s2) == 1:
-                return s_
-            first = s2.pop(0)
-            s2 = [(numSpaces * " ") + line for line in s2]
-            s = "\n".join(s2)
-            s = first + "\n" + s
-            return s
+            return s_.replace("\n", "\n" + numSpaces * " ")
 
         child_lines = []
 
@@ -245,18 +314,20 @@ class Parameter:
     def __init__(self, x: Any, name: Optional[str] = None) -> None:
         self.value = x
         self.name = name
-        if hasattr(x, "requires_grad_"):
-            self.value.requires_grad_(True)
+        requires_grad_ = getattr(x, "requires_grad_", None)
+        if requires_grad_ is not None:
+            requires_grad_(True)
             if self.name:
-                self.value.name = self.name
+                x.name = self.name
 
     def update(self, x: Any) -> None:
         """Update the parameter value."""
         self.value = x
-        if hasattr(x, "requires_grad_"):
-            self.value.requires_grad_(True)
+        requires_grad_ = getattr(x, "requires_grad_", None)
+        if requires_grad_ is not None:
+            requires_grad_(True)
             if self.name:
-                self.value.name = self.name
+                x.name = self.name
 
     def __repr__(self) -> str:
         return repr(self.value)
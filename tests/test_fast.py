@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from hypothesis import given
+
+from minitorch import _fast, operators
+
+from .strategies import small_floats
+
+
+@pytest.mark.task0_1
+@given(small_floats, small_floats)
+def test_fast_scalar_kernels(a: float, b: float) -> None:
+    """Check that the compiled kernels agree with the pure Python operators"""
+    assert _fast.sigmoid_nb(a) == pytest.approx(operators.sigmoid(a))
+    assert _fast.relu_nb(a) == operators.relu(a)
+    assert _fast.exp_nb(a) == pytest.approx(operators.exp(a))
+    assert _fast.log_nb(abs(a) + 1) == pytest.approx(operators.log(abs(a) + 1))
+    assert _fast.relu_back_nb(a, b) == operators.relu_back(a, b)
+    assert _fast.log_back_nb(abs(a) + 1, b) == pytest.approx(
+        operators.log_back(abs(a) + 1, b)
+    )
+
+
+@pytest.mark.task0_1
+def test_fast_array_kernels() -> None:
+    x = np.linspace(-50.0, 50.0, 101)
+    s = np.array([operators.sigmoid(float(a)) for a in x])
+    np.testing.assert_allclose(_fast.sigmoid_vec(x), s, rtol=1e-6)
+    np.testing.assert_allclose(_fast.relu_vec(x), np.maximum(x, 0.0))
+    np.testing.assert_allclose(
+        _fast.sigmoid_back_vec(x, np.ones_like(x)), s * (1.0 - s), rtol=1e-6
+    )
+    x32 = x.astype(np.float32)
+    assert _fast.sigmoid_vec(x32).dtype == np.float32
@@ -1,3 +1,7 @@
+import copy
+import pickle
+
+import numpy as np
 import pytest
 from hypothesis import given
 
@@ -137,6 +141,25 @@ def test_stacked_module(size_a: int, size_b: int, val: float) -> None:
     assert named_parameters["module_b.parameter_b"].value == VAL_B
 
 
+@pytest.mark.task0_4
+@given(med_ints, med_ints, small_floats)
+def test_flatten_parameters(size_a: int, size_b: int, val: float) -> None:
+    """Check that parameter values become views into one flat buffer"""
+    module = Module1(size_a, size_b, val)
+    flat = module.flatten_parameters()
+
+    assert flat.shape == (len(module.parameters()),)
+    assert flat.dtype == np.float32
+    named_parameters = dict(module.named_parameters())
+    assert named_parameters["parameter_a"].value == np.float32(val)
+    assert named_parameters["module_a.parameter_b"].value == VAL_B
+
+    # Updating the buffer updates every parameter in place
+    flat -= 1.0
+    assert named_parameters["module_a.parameter_b"].value == VAL_B - 1.0
+    assert named_parameters["module_b.module_c.parameter_a"].value == VAL_A - 1.0
+
+
 # ## Misc Tests
 
 # Check that the module runs forward correctly.
@@ -163,6 +186,59 @@ def test_module_forward() -> None:
     assert mod() == 10
 
 
+@pytest.mark.task0_4
+def test_module_lazy_storage() -> None:
+    """Leaf modules share empty storage until something is assigned"""
+    leaf1 = minitorch.Module()
+    leaf2 = minitorch.Module()
+    assert leaf1._parameters is leaf2._parameters
+    assert leaf1.modules() == []
+    assert leaf1.parameters() == []
+
+    leaf1.p = minitorch.Parameter(1)
+    leaf1.child = leaf2
+    assert leaf1.p.value == 1
+    assert leaf1.modules() == [leaf2]
+    assert leaf2._parameters is not leaf1._parameters
+    assert len(leaf2.parameters()) == 0
+
+
+@pytest.mark.task0_4
+def test_module_attach_through_setattr() -> None:
+    """Children are attached by attribute assignment"""
+    root = minitorch.Module()
+    branch1 = minitorch.Module()
+    branch2 = minitorch.Module()
+    root.branch1 = branch1
+    root.branch2 = branch2
+    branch1.leaf = minitorch.Module()
+    assert root.modules() == [branch1, branch2]
+    assert root.branch1.leaf is branch1.leaf
+
+
+@pytest.mark.task0_4
+def test_module_copy_and_pickle() -> None:
+    mod = RootModule()
+    mod.eval()
+    for other in (copy.deepcopy(mod), pickle.loads(pickle.dumps(mod))):
+        names = set(dict(other.named_parameters()))
+        assert names == {"a.aa.p1", "a.ab.p2", "b.ba.p3"}
+        assert other.a.aa.p1.value == 1
+        assert not other.b.ba.training
+        # Storage restored from the shared empty sentinel is writable
+        other.a.aa.extra = minitorch.Module()
+        assert other.a.aa.modules() == [other.a.aa.extra]
+    assert mod.a.aa.modules() == []
+
+
+@pytest.mark.task0_4
+def test_module_plain_attributes() -> None:
+    mod = minitorch.Module()
+    mod.foo = 1
+    assert mod.foo == 1
+    assert mod.missing is None
+
+
 # Internal check for the system.
 
 
@@ -269,3 +345,55 @@ def test_cycle_breaks_named_parameters():
     assert np["p"].value == 42
     assert np["a.p_child"].value == 99
     assert np["a.a_cycle.p"].value == 42
+
+
+@pytest.mark.task0_4
+def test_cycle_train_eval() -> None:
+    mod = ModuleCycleTest()
+
+    # Visited modules are tracked, so the cycle terminates
+    mod.eval()
+    assert not mod.training
+    assert not mod.a.training
+    mod.train()
+    assert mod.training
+    assert mod.a.training
+
+
+@pytest.mark.task0_4
+def test_eval_reaches_child_added_after_eval() -> None:
+    root = minitorch.Module()
+    root.eval()
+    root.head = minitorch.Module()
+    assert root.head.training
+    root.eval()
+    assert not root.training
+    assert not root.head.training
+
+
+@pytest.mark.task0_4
+def test_mode_mixed_subtree() -> None:
+    root = RootModule()
+    root.a.eval()
+    root.a.aa.train()
+    assert not root.a.training
+    assert root.a.aa.training
+    root.eval()
+    assert not root.a.training
+    assert not root.a.aa.training
+    assert not root.a.ab.training
+    root.b.ba.eval()
+    root.train()
+    assert root.b.training
+    assert root.b.ba.training
+
+
+@pytest.mark.task0_4
+def test_cycle_flatten_parameters() -> None:
+    mod = ModuleCycleTest()
+    flat = mod.flatten_parameters()
+
+    # the parameter reachable through the cycle is stored only once
+    assert sorted(flat.tolist()) == [42.0, 99.0]
+    assert mod.p.value == 42
+    assert mod.a.p_child.value == 99
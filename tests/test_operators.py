@@ -1,11 +1,14 @@
+import math
+from fractions import Fraction
 from typing import Callable, List, Tuple
 
+import numpy as np
 import pytest
 from hypothesis import given
 from hypothesis.strategies import lists
 
 import minitorch
-from minitorch import MathTest
+from minitorch import MathTest, _fast
 from minitorch.operators import (
     add,
     addLists,
@@ -23,6 +26,7 @@ from minitorch.operators import (
     relu,
     relu_back,
     sigmoid,
+    sigmoid_with_back,
 )
 
 from .strategies import assert_close, small_floats
@@ -60,6 +64,25 @@ def test_relu_back(a: float, b: float) -> None:
         assert relu_back(a, b) == 0.0
 
 
+@pytest.mark.task0_1
+@given(small_floats, small_floats)
+def test_sigmoid_with_back(a: float, b: float) -> None:
+    s, d = sigmoid_with_back(a, b)
+    assert s == sigmoid(a)
+    h = 1e-6
+    assert_close(d, b * (sigmoid(a + h) - sigmoid(a - h)) / (2 * h))
+
+
+@pytest.mark.task0_1
+def test_special_values() -> None:
+    """Edge cases keep the behaviour of the original branching versions"""
+    nan, inf = float("nan"), float("inf")
+    assert relu_back(-1.0, inf) == 0.0
+    assert math.copysign(1.0, relu_back(-1.0, -2.0)) == 1.0
+    assert math.isnan(max(nan, 1.0))
+    assert max(1.0, nan) == 1.0
+
+
 @pytest.mark.task0_1
 @given(small_floats)
 def test_id(a: float) -> None:
@@ -91,6 +114,16 @@ def test_eq(a: float) -> None:
     assert eq(a, a + 1.0) == 0.0
 
 
+@pytest.mark.task0_1
+def test_array_default_dtype() -> None:
+    """Float64 arrays are computed in float32, other dtypes are kept"""
+    assert relu(np.array([1.0, -2.0])).dtype == np.float32
+    assert relu(np.array([2**40, -2])).tolist() == [2**40, 0]
+    assert minitorch.operators._sigmoid_array(np.array([0, 1])).tolist()[0] == 0.5
+    assert relu(np.array([1.0], dtype=np.float16)).dtype == np.float16
+    assert minitorch.operators.exp(np.array([1j])).dtype == np.complex128
+
+
 # ## Task 0.2 - Property Testing
 
 # Implement the following property checks
@@ -118,6 +151,50 @@ def test_sigmoid(a: float) -> None:
         assert value < sigmoid(a + 1e-2)
 
 
+@pytest.mark.task0_2
+@given(lists(small_floats, min_size=1))
+def test_sigmoid_array(ls: List[float]) -> None:
+    """Check that the vectorized sigmoid matches the scalar version"""
+    out = sigmoid(np.array(ls))
+    assert isinstance(out, np.ndarray)
+    assert out.dtype == np.float32
+    # NumPy-only fallback used when SciPy is not installed
+    fallback = minitorch.operators._sigmoid_array(np.array(ls, dtype=np.float32))
+    for a, value, other in zip(ls, out, fallback):
+        assert value == pytest.approx(sigmoid(a), rel=1e-6, abs=1e-12)
+        assert other == pytest.approx(sigmoid(a), rel=1e-6, abs=1e-12)
+
+
+@pytest.mark.task0_2
+def test_sigmoid_without_scipy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check the fallbacks used when SciPy is not installed"""
+    xs = np.linspace(-50.0, 50.0, 201)
+    expected = [sigmoid(float(a)) for a in xs]
+    monkeypatch.setattr(minitorch.operators, "_expit", None)
+
+    for a, value in zip(xs, expected):
+        assert sigmoid(float(a)) == pytest.approx(value)
+
+    # contiguous float32 arrays use the compiled kernel, others the masked path
+    calls = []
+    compiled = _fast.sigmoid_vec
+
+    def spy(x: np.ndarray) -> np.ndarray:
+        calls.append(x)
+        return compiled(x)
+
+    monkeypatch.setattr(_fast, "sigmoid_vec", spy)
+    x32 = xs.astype(np.float32)
+    out = sigmoid(x32)
+    assert len(calls) == 1
+    np.testing.assert_allclose(out, expected, rtol=1e-6, atol=1e-12)
+
+    out = sigmoid(x32[::2])
+    assert len(calls) == 1
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected[::2], rtol=1e-6, atol=1e-12)
+
+
 @pytest.mark.task0_2
 @given(small_floats, small_floats, small_floats)
 def test_transitive(a: float, b: float, c: float) -> None:
@@ -171,6 +248,36 @@ def test_zip_with(a: float, b: float, c: float, d: float) -> None:
     assert_close(x2, y2)
 
 
+@pytest.mark.task0_3
+@given(lists(small_floats), lists(small_floats))
+def test_add_lists_shortest(ls1: List[float], ls2: List[float]) -> None:
+    """Check that addLists stops at the end of the shorter list"""
+    out = list(addLists(ls1, ls2))
+    assert len(out) == min(len(ls1), len(ls2))
+    for x, a, b in zip(out, ls1, ls2):
+        assert_close(x, a + b)
+
+
+@pytest.mark.task0_3
+def test_higher_order_keep_exact_types() -> None:
+    """Non-float inputs must not be coerced to float64"""
+    assert negList([5, 6]) == [-5, -6]
+    assert minitorch.operators.sum([2**60, 1]) == 2**60 + 1
+    assert prod([Fraction(1, 3), 3]) == 1
+    assert list(addLists(iter([1.0, 2.0]), (3.0,))) == [4.0]
+
+
+@pytest.mark.task0_3
+def test_higher_order_ndarray() -> None:
+    """NumPy arrays take the ufunc path and give the same results as lists"""
+    a = np.array([1.0, 2.0, 3.0])
+    b = np.array([4.0, 5.0])
+    assert negList(a) == [-1.0, -2.0, -3.0]
+    assert addLists(a, b) == [5.0, 7.0]
+    assert minitorch.operators.sum(a) == 6.0
+    assert prod(a) == 6.0
+
+
 @pytest.mark.task0_3
 @given(
     lists(small_floats, min_size=5, max_size=5),